@@ -3,56 +3,330 @@ from tkinter import filedialog, messagebox
 import tkinter.font as tkfont
 import datetime
 import os
-import glob
+import io
 import tkinter.ttk as ttk
 import sys
+import threading
 import json
+import queue
+import collections
+import re
+from pathlib import Path
+
+# orjson is optional; when installed it encodes the JSON export much faster than the stdlib. Its output differs
+# in ways no orjson option changes: non-ASCII text is written as UTF-8 rather than \u escapes, NaN/inf become
+# null (valid JSON) rather than NaN/Infinity, and exponents drop the leading zero (1e-7 rather than 1e-07)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add current directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-# Updated imports to look in metadata_extractors subfolder
-try:
-    from metadata_extractors.CZI_MetadataGUI import extract_metadata
-    from metadata_extractors.LIF_MetadataGUI import extract_lif_metadata
-    from metadata_extractors.Nd2_v2a import extract_nd2_metadata, map_nd2_to_remind_fields
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure the metadata_extractors folder contains the required files")
-    sys.exit(1)
+# The metadata extractors (and the reader libraries behind them) live in the metadata_extractors
+# subfolder and are only imported when a file of their format is loaded, keeping startup light
 
 APP_VERSION = "ReMInD Lite v2.27"
 APP_AUTHOR = "Nicholas Condon, IMB Microscopy, The University of Queensland, Brisbane Australia"
 APP_DATE = "June 2025"
 
+# Widget kinds for REMBIGUI._dispatch; KIND_VAR is anything with get()/set() (StringVars and Comboboxes)
+KIND_VAR, KIND_ENTRY, KIND_TEXT = range(3)
+
+# A "Label: value" ReadMe line, split at the first ": "
+_LINE_RE = re.compile(r"(.+?): (.*)")
+
+# One pass over a ReadMe: comment lines, "Label:" + --- delimited blocks, or "Label: value" lines
+_README_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"#[^\n]*"
+    r"|(?P<label>[^\n]*?):[ \t]*\n[ \t]*---[ \t]*(?:\n(?P<block>.*?))??(?:\n[ \t]*---[ \t]*$|\n?\Z)"
+    r"|(?P<key>\S[^\n]*?): (?P<value>[^\n]*)"
+    r")",
+    re.MULTILINE | re.DOTALL,
+)
+
+_METADATA_HEADER_RE = re.compile(r"^[ \t]*# Extracted Image Metadata[ \t]*$", re.MULTILINE)
+
+# Characters dropped from names used as default file names: anything but letters, digits, space, - and _
+# (Unicode \w is exactly str.isalnum() plus _)
+_FILENAME_STRIP_RE = re.compile(r"[^\w -]")
+
+_now = datetime.datetime.now
+
+
+def _timestamp():
+    """Current local time as "YYYY-MM-DD HH:MM:SS", for the Now and Timestamp buttons."""
+    return _now().isoformat(sep=" ", timespec="seconds")
+
+
+# Form fields as (label, options, tooltip); a tuple of options makes the field a combobox
+FIELDS = (
+    ("Experiment name", "", "Title of the experiment."),
+    ("RDM Info", "", "Green Indicator = connection to InstGateway successful, otherwise write the RDM project or storage info "),
+    ("Date and time", "", "Date and time of acquisition. The Now button will autopopulate the fields"),
+    ("Experimentor Name(s)", "", "Enter your full name."),
+    ("Sample Information", "", "e.g. Sample ID, or cell line, animal strain"),
+    ("Genetic Modifications", "", "e.g. eGFP- mCherry-y"),
+    ("Antibody or probes", "", "e.g. Alexa488-Phalloidin, DAPI, Alexa647-GaM"),
+    ("Fixation / Live Media", "", "Fixation method used, or details of live imaging reagents"),
+    ("Sample mounting condition", "", "35mm Dish, #1.5 coverslip, chamber slide"),
+    ("Microscope name", "", "e.g. Confocal 5"),
+    ("Objective", "", "Objective lens details. e.g. Plan Apochromat 63x 1.4NA"),
+    ("Immersion", ("Air", "Water", "Immersol W", "Glycerol", "Silicone", "Oil-23", "Oil-37", "Other"), "Select the immersion used."),
+    ("Imaging mode", ("Confocal", "Widefield", "Spinning Disc Confocal", "Lightsheet", "Other"), "Select the imaging mode used."),
+    ("Specialist modality", ("", "Airyscan", "STED", "FLIM", "2Photon", "TIRF", "Other"), "Select any specialist imaging modality used."),
+    ("Environmental Conditions", "", "e.g. Temperature and CO2"),
+    ("Channel info", "", "Channel names, stains or labels used."),
+    ("Z-stack", ("Yes", "No", "Both"), "Was a Z-stack acquired?"),
+    ("Time series", ("Yes", "No", "Both"), "Was this a time-lapse series?"),
+    ("Image format", "", "Image file format (e.g., .czi, .tif, .lif)."),
+    ("Notes", "", "Analysis intent or relevant notes."),
+)
+
+# CZI and LIF summary keys behind each form field, in fill order; None marks fields filled specially or left alone
+IMAGE_FIELD_MAP = (
+    ("Experiment name", None),  # Do not auto-fill from file name
+    ("Date and time", "Document Creation Date"),
+    ("Experimentor Name(s)", "Document User Name"),
+    ("Microscope name", "System Name"),
+    ("Objective", "Objective Model"),
+    ("Immersion", "Objective Medium"),
+    ("Imaging mode", "Acquisition Modes"),
+    ("Channel info", "Channel Names"),
+    ("Image format", None),
+    ("Notes", None),
+)
+
+# Help page contents as (text, tag) pairs, inserted into the help window in a single call
+HELP_TEXT = (
+    ("📄 ReMInD - Recommended Metadata Interface for Documentation Help\n\n", "title"),
+    ("This tool was created by Nicholas Condon (UQ) from IMB Microscopy in 2025.\n\n"
+     "The purpose of this tool is to help capture additional metadata to store with your RAW experimental data.\n\n", ""),
+    ("✒️ Entering Information \n", "subtitle"),
+    ("\t• Not every field needs to be filled in.\n"
+     "\t• If the tool can detect UQ-InstGateway then a list of available RDMs will be shown, if not connected it will warn you and allow free text input.\n"
+     "\t• Hover your cursor over the text box for more description for the field.\n"
+     "\t• Some fields contain drop down lists you can choose items from, if choosing 'other' provide the information in the notes box.\n"
+     "\t• The notes box can be filled in with as much detail as possible. You can use the 'Timestamp' button to generate a new line with the date and time.\n\n", ""),
+    ("🔬 Load Fields from Image File \n", "subtitle"),
+    ("\t• Click 'Load Fields from Image File' to automatically extract metadata from your image files.\n"
+     "\t• Supported formats: CZI (Zeiss), LIF (Leica), and ND2 (Nikon) files.\n"
+     "\t• The tool will automatically populate relevant fields with metadata from the image file including:\n"
+     "\t\t- Date and time of acquisition\n"
+     "\t\t- Microscope name and settings\n"
+     "\t\t- Objective lens information\n"
+     "\t\t- Channel information\n"
+     "\t\t- Imaging parameters (Z-stack, time series)\n"
+     "\t\t- Software and system information\n"
+     "\t• Extracted metadata will be displayed in the 'Extracted Image Metadata' section.\n"
+     "\t• You can review and edit the imported information before generating your ReadMe file.\n"
+     "\t• The raw metadata is also included when exporting as JSON or generating ReadMe files.\n\n", ""),
+    ("💾 Generate ReadMe.txt\n", "subtitle"),
+    ("\t• Once you have filled in the form to your liking you can save a ReadMe.txt file to any location (ideally within the data folder it's associated with).\n"
+     "\t• Save the ReadMe.txt file alongside the captured data.\n"
+     "\t• Use a filename that includes 'ReadMe' and the experiment name if needed.\n"
+     "\t• Empty fields are left out of the ReadMe; tick 'Include empty fields in ReadMe' to keep a line for every field.\n"
+     "\t• If you imported metadata from an image file, the raw metadata will be appended to the ReadMe file.\n\n", ""),
+    ("📂 Load ReadMe.txt\n", "subtitle"),
+    ("\t• The program has the ability to read a previously generated ReadMe file and repopulate the fields for quick editing/updating.\n"
+     "\t• This can be particularly useful when adding to the notes section.\n\n", ""),
+    ("📖 Templates \n", "subtitle"),
+    ("\t• The program automatically looks for any template files stored in the same location as the executable.\n"
+     "\t• Any template file must be saved as *_ReadMe_template.txt with something in place of the *.\n"
+     "\t• Multiple templates can be handled with a popup on startup allowing you to choose from a template or skip.\n\n", ""),
+    ("📁 Export as JSON\n", "subtitle"),
+    ("\t• Export all form data and extracted metadata as a structured JSON file.\n"
+     "\t• Useful for data processing, analysis workflows, or integration with other tools.\n"
+     "\t• Includes both form entries and raw extracted image metadata.\n\n", ""),
+    ("📌 Tips:\n", "subtitle"),
+    ("\t• Use a previously generated ReadMe.txt file as a template to pre-load certain fields such as RDM Info, Name, Sample information etc.\n"
+     "\t• If you're iterating on an experiment, consider labeling your files like ReadMe_exp1_v1.txt, v2, etc.\n"
+     "\t• Be descriptive: When entering experiment details, use full names, reagent IDs, microscope configurations, etc.\n"
+     "\t• Always load metadata from your original image files first, then supplement with additional information.\n"
+     "\t• Review imported metadata for accuracy - some fields may need manual correction or additional detail.\n"
+     "\t• Use the metadata extraction feature to ensure consistency across multiple experiments.\n\n", ""),
+    ("🙏 Acknowledgements\n", "subtitle"),
+    ("This tool uses several open-source libraries for metadata extraction:\n\n"
+     "\t• czifile by Christoph Gohlke - For reading Zeiss CZI files\n"
+     "\t\t  https://github.com/cgohlke/czifile\n\n"
+     "\t• readlif by Nimesh Khadka - For reading Leica LIF files\n"
+     "\t\t  https://github.com/nimne/readlif\n\n"
+     "\t• nd2 by Talley Lambert - For reading Nikon ND2 files\n"
+     "\t\t  https://github.com/tlambert03/nd2\n\n"
+     "\t• Python standard libraries: tkinter, json, datetime, os\n\n"
+     "Special thanks to the open-source community for making microscopy metadata\n"
+     "accessible and standardized across different imaging platforms.\n\n"
+     "For support or feature requests, contact IMB Microscopy at The University of Queensland.", ""),
+)
+
 class ToolTip:
+    # A single tooltip window is shared by every ToolTip and moved/relabelled on hover rather than rebuilt
+    _tip = None
+    _tip_label = None
+    # Hover events reach tooltips through one class binding tag instead of per-widget binds
+    BINDTAG = "ReMInDTooltip"
+    _tooltips = {}  # widget path -> ToolTip
+    _bound = False
+    __slots__ = ("widget", "text")
+
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip = None
-        self.widget.bind("<Enter>", self.show)
-        self.widget.bind("<Leave>", self.hide)
+        if not ToolTip._bound:
+            widget.bind_class(ToolTip.BINDTAG, "<Enter>", ToolTip._on_enter)
+            widget.bind_class(ToolTip.BINDTAG, "<Leave>", ToolTip._on_leave)
+            widget.bind_class(ToolTip.BINDTAG, "<Destroy>", ToolTip._on_destroy)
+            ToolTip._bound = True
+        ToolTip._tooltips[str(widget)] = self
+        widget.bindtags(widget.bindtags() + (ToolTip.BINDTAG,))
+
+    @classmethod
+    def _on_enter(cls, event):
+        tooltip = cls._tooltips.get(str(event.widget))
+        if tooltip is not None:
+            tooltip.show(event)
+
+    @classmethod
+    def _on_leave(cls, event):
+        if cls._tip is not None:
+            cls._tip.withdraw()
+
+    @classmethod
+    def _on_destroy(cls, event):
+        cls._tooltips.pop(str(event.widget), None)
 
     def show(self, event=None):
-        if self.tooltip or not self.text:
+        if not self.text:
             return
         x, y, _, _ = self.widget.bbox("insert")
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.geometry(f"+{x}+{y}")
-        label = tk.Label(self.tooltip, text=self.text, justify='left',
-                         background="#ffffe0", relief='solid', borderwidth=1,
-                         font=("tahoma", "8", "normal"))
-        label.pack(ipadx=1)
+        tip = ToolTip._tip
+        if tip is None or not tip.winfo_exists():
+            # Parent it on the root window so it outlives any single widget that shows it
+            tip = ToolTip._tip = tk.Toplevel(self.widget._root())
+            tip.wm_overrideredirect(True)
+            ToolTip._tip_label = tk.Label(tip, justify='left',
+                                          background="#ffffe0", relief='solid', borderwidth=1,
+                                          font=("tahoma", "8", "normal"))
+            ToolTip._tip_label.pack(ipadx=1)
+        ToolTip._tip_label.config(text=self.text)
+        tip.geometry(f"+{x}+{y}")
+        tip.deiconify()
+        tip.lift()
 
     def hide(self, event=None):
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if ToolTip._tip is not None:
+            ToolTip._tip.withdraw()
+
+
+def _bulk_set_text(text_box, value):
+    """Replace the contents of a Text widget without recording the edit on its undo stack."""
+    undo = text_box.cget("undo")
+    text_box.configure(undo=False)
+    text_box.delete("1.0", tk.END)
+    if value:
+        text_box.insert("1.0", value)
+    text_box.configure(undo=undo)
+    # Older undo entries describe text that is no longer there
+    text_box.edit_reset()
+
+
+def _iter_readme_fields(text):
+    """Yield (label, value) pairs from ReadMe text; a "Label:" line followed by --- opens a multi-line block."""
+    for match in _README_RE.finditer(text):
+        label, block, key, value = match.group("label", "block", "key", "value")
+        if label is not None:
+            yield label.strip(), block or ""
+        elif key is not None:
+            value = value.strip()
+            if value:
+                yield key.strip(), value
+
+
+def _format_value(value):
+    """Render a metadata value for display: lists become one comma-separated string, anything else is unchanged."""
+    if isinstance(value, list):
+        return ", ".join(map(str, value))
+    return value
+
+
+def _format_metadata(metadata):
+    """Format extracted metadata as "Key: value" lines, each ending in a newline."""
+    return "".join([f"{k}: {_format_value(v)}\n" for k, v in metadata.items()])
+
+
+def _parse_readme(text):
+    """Split a ReadMe into its (label, value) form fields and the dict under "# Extracted Image Metadata"."""
+    # Form fields come first; everything after the "Extracted Image Metadata" header is metadata
+    header = _METADATA_HEADER_RE.search(text)
+    form_text, metadata_text = (text[:header.start()], text[header.end():]) if header else (text, "")
+
+    extracted_metadata = {}
+    for metadata_line in metadata_text.splitlines():
+        match = _LINE_RE.match(metadata_line.strip())
+        if match:
+            key, value = match.groups()
+            # Convert comma-separated values back to lists where appropriate
+            if ", " in value and key in ["Channel Names", "Acquisition Modes"]:
+                extracted_metadata[key] = value.split(", ")
+            else:
+                extracted_metadata[key] = value
+    return list(_iter_readme_fields(form_text)), extracted_metadata
+
+
+# Templates are picked up from the working directory by this file name suffix, compared using the
+# platform's case rules (case-insensitive on Windows)
+TEMPLATE_SUFFIX = os.path.normcase("_ReadME_template.txt")
+
+# Extractor results kept per session for files that are loaded again unchanged
+METADATA_CACHE_SIZE = 16
+
+# Parsed templates are kept here as JSON between launches, one entry per absolute path that is replaced when the
+# file changes; only the TEMPLATE_CACHE_SIZE most recently written are kept, so stale paths age out
+TEMPLATE_CACHE_SIZE = 32
+TEMPLATE_CACHE_PATH = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"), "remind", "templates_lite.json")
+
+
+def _read_template_cached(path):
+    """Return _parse_readme() of the file at path, reusing the copy cached on an earlier launch if it is unchanged."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    try:
+        with open(TEMPLATE_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict):
+        cache = {}
+    entry = cache.get(path)
+    if isinstance(entry, list) and len(entry) == 3 and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        # JSON hands back lists, so rebuild the tuples; an entry of the wrong shape is simply re-parsed
+        try:
+            fields, extracted_metadata = entry[2]
+            return [(label, value) for label, value in fields], dict(extracted_metadata)
+        except (TypeError, ValueError):
+            pass
+
+    parsed = _parse_readme(Path(path).read_text(encoding="utf-8"))
+    # Re-insert so the dict stays in least-recently-written order, keep only well-formed entries and cap it
+    cache.pop(path, None)
+    cache[path] = [stat.st_mtime_ns, stat.st_size, parsed]
+    cache = {p: e for p, e in list(cache.items())[-TEMPLATE_CACHE_SIZE:] if isinstance(e, list) and len(e) == 3}
+    try:
+        os.makedirs(os.path.dirname(TEMPLATE_CACHE_PATH), exist_ok=True)
+        tmp_path = TEMPLATE_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, TEMPLATE_CACHE_PATH)
+    except OSError:
+        pass  # The cache only saves a re-parse; never fail a template load over it
+    return parsed
 
 
 class REMBIGUI:
@@ -63,6 +337,7 @@ class REMBIGUI:
         # Get screen dimensions
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
+        self._screen_width = screen_width  # Reused by build_form for the button layout
         
         # Calculate appropriate window size - make it narrower
         if screen_width >= 1920:
@@ -92,7 +367,13 @@ class REMBIGUI:
 
         self.entries = {}
         self.extra_fields = {}
+        self.extra_labels = {}  # label -> the "(Other)" caption shown next to its extra field
+        self.hidden_extra_fields = {}  # label -> extra field hidden after "Other" was deselected
         self.text_fields = {}
+        self._dispatch = {}  # label -> (kind, widget) for reading and setting field values
+        self._help_window = None
+        self._metadata_cache = collections.OrderedDict()  # (realpath, mtime_ns, size) -> extractor result, oldest first
+        self._metadata_listing = (None, "")  # (metadata dict, its formatted "Key: value" lines) last shown in the panel
 
         # Font size management - adjust based on screen size
         base_size = 10 if screen_width >= 1920 else 9 if screen_width >= 1200 else 8
@@ -101,29 +382,6 @@ class REMBIGUI:
         self.app_font = tkfont.Font(family=self.font_family, size=self.base_font_size)
         self.bold_font = tkfont.Font(family=self.font_family, size=self.base_font_size, weight="bold")
 
-        self.fields = [
-            ("Experiment name", "", "Title of the experiment."),
-            ("RDM Info", "", "Green Indicator = connection to InstGateway successful, otherwise write the RDM project or storage info "),
-            ("Date and time", "", "Date and time of acquisition. The Now button will autopopulate the fields"),
-            ("Experimentor Name(s)", "", "Enter your full name."),
-            ("Sample Information", "", "e.g. Sample ID, or cell line, animal strain"),
-            ("Genetic Modifications", "", "e.g. eGFP- mCherry-y"),
-            ("Antibody or probes", "", "e.g. Alexa488-Phalloidin, DAPI, Alexa647-GaM"),
-            ("Fixation / Live Media", "", "Fixation method used, or details of live imaging reagents"),
-            ("Sample mounting condition", "", "35mm Dish, #1.5 coverslip, chamber slide"),
-            ("Microscope name", "", "e.g. Confocal 5"),
-            ("Objective", "", "Objective lens details. e.g. Plan Apochromat 63x 1.4NA"),
-            ("Immersion", ["Air", "Water", "Immersol W", "Glycerol", "Silicone", "Oil-23", "Oil-37", "Other"], "Select the immersion used."),
-            ("Imaging mode", ["Confocal", "Widefield", "Spinning Disc Confocal", "Lightsheet", "Other"], "Select the imaging mode used."),
-            ("Specialist modality", ["", "Airyscan", "STED", "FLIM", "2Photon", "TIRF", "Other"], "Select any specialist imaging modality used."),
-            ("Environmental Conditions", "", "e.g. Temperature and CO2"),
-            ("Channel info", "", "Channel names, stains or labels used."),
-            ("Z-stack", ["Yes", "No", "Both"], "Was a Z-stack acquired?"),
-            ("Time series", ["Yes", "No", "Both"], "Was this a time-lapse series?"),
-            ("Image format", "", "Image file format (e.g., .czi, .tif, .lif)."),
-            ("Notes", "", "Analysis intent or relevant notes."),
-        ]
-
         self.build_form()
         self.root.after(200, self.select_and_load_template)
 
@@ -135,40 +393,57 @@ class REMBIGUI:
     def build_form(self):
         # Use self.form_root instead of self.root for all grid operations
         parent = self.form_root if hasattr(self, 'form_root') else self.root
-        
+
+        # Configure the columns once, up front
+        parent.grid_columnconfigure(1, weight=1)
+
         self.row_counter = 0
-        for label, options, tooltip_text in self.fields:
-            tk.Label(parent, text=label, font=self.app_font).grid(row=self.row_counter, column=0, sticky="e", padx=5, pady=2)
+        other_labels = []  # Combobox labels, in form order, that can spill into an "(Other)" row
+        for label, options, tooltip_text in FIELDS:
+            ttk.Label(parent, text=label, font=self.app_font).grid(row=self.row_counter, column=0, sticky="e", padx=5, pady=2)
 
             if label == "RDM Info":
                 # Simple text entry field - no LED indicator or connectivity check
                 entry = tk.Entry(parent, font=self.app_font)
                 entry.grid(row=self.row_counter, column=1, padx=5, pady=2, sticky="ew")
                 self.entries[label] = entry
+                self._dispatch[label] = (KIND_ENTRY, entry)
                 ToolTip(entry, tooltip_text)
 
-            elif isinstance(options, list):
-                var = tk.StringVar()
-                combo = ttk.Combobox(parent, textvariable=var, values=options, state="normal", font=self.app_font, style="TCombobox")
+            elif isinstance(options, tuple):
+                combo = ttk.Combobox(parent, values=options, state="normal", font=self.app_font, style="TCombobox")
                 combo.grid(row=self.row_counter, column=1, padx=5, pady=2, sticky="ew")
-                self.entries[label] = var
+                self.entries[label] = combo
+                self._dispatch[label] = (KIND_VAR, combo)
                 ToolTip(combo, tooltip_text)
 
-                def handle_other(event, label=label):
-                    if var.get() == "Other":
-                        if label not in self.extra_fields:
-                            other_row = self.row_counter + len(self.extra_fields) + 1
+                def handle_other(event, label=label, combo=combo):
+                    if combo.get() == "Other":
+                        if label in self.hidden_extra_fields:
+                            entry = self.hidden_extra_fields.pop(label)
+                            entry.grid()
+                            self.extra_labels[label].grid()
+                            self.extra_fields[label] = entry
+                        elif label not in self.extra_fields:
+                            # Each label owns a fixed row below the form, so extras keep the form's order
+                            other_row = self._other_row_for[label]
                             entry = tk.Entry(parent, font=self.app_font)
                             entry.grid(row=other_row, column=1, padx=5, pady=2, sticky="ew")
-                            tk.Label(parent, text=f"{label} (Other)", font=self.app_font).grid(row=other_row, column=0, sticky="e")
+                            other_label = ttk.Label(parent, text=f"{label} (Other)", font=self.app_font)
+                            other_label.grid(row=other_row, column=0, sticky="e")
                             self.extra_fields[label] = entry
+                            self.extra_labels[label] = other_label
                             ToolTip(entry, f"Specify 'Other' for {label.lower()}")
                     else:
                         if label in self.extra_fields:
-                            self.extra_fields[label].destroy()
-                            del self.extra_fields[label]
+                            # Hide rather than destroy, so choosing Other again restores the row and its text
+                            entry = self.extra_fields.pop(label)
+                            entry.grid_remove()
+                            self.extra_labels[label].grid_remove()
+                            self.hidden_extra_fields[label] = entry
 
                 combo.bind("<<ComboboxSelected>>", handle_other)
+                other_labels.append(label)
 
             elif label == "Date and time":
                 frame = tk.Frame(parent)
@@ -177,12 +452,12 @@ class REMBIGUI:
                 date_entry = tk.Entry(frame)
                 date_entry.pack(side="left", fill="x", expand=True)
                 self.entries[label] = date_entry
+                self._dispatch[label] = (KIND_ENTRY, date_entry)
                 ToolTip(date_entry, tooltip_text)
 
                 def insert_datetime(entry_widget=date_entry):
-                    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     entry_widget.delete(0, tk.END)
-                    entry_widget.insert(0, now)
+                    entry_widget.insert(0, _timestamp())
 
                 timestamp_btn = tk.Button(frame, text="Now", command=insert_datetime, font=self.app_font)
                 timestamp_btn.pack(side="right", padx=5)
@@ -192,15 +467,18 @@ class REMBIGUI:
                 frame = tk.Frame(parent)
                 frame.grid(row=self.row_counter, column=1, padx=5, pady=2, sticky="ew")
 
-                text_box = tk.Text(frame, height=8, width=50, font=self.app_font)  # Reduced height for small screens
+                text_box = tk.Text(frame, height=8, width=50, font=self.app_font,
+                                   undo=True, maxundo=200, autoseparators=True)  # Reduced height for small screens
                 text_box.pack(side="left", fill="both", expand=True)
+                # Close the current undo group whenever focus leaves, so undo steps stay coarse
+                text_box.bind("<FocusOut>", lambda e, tb=text_box: tb.edit_separator())
                 self.entries[label] = text_box
                 self.text_fields[label] = text_box
+                self._dispatch[label] = (KIND_TEXT, text_box)
                 ToolTip(text_box, tooltip_text)
 
                 def insert_timestamp():
-                    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    text_box.insert(tk.END, f"\n[{now}] ")
+                    text_box.insert(tk.END, f"\n[{_timestamp()}] ")
 
                 timestamp_btn = tk.Button(frame, text="Timestamp", command=insert_timestamp, font=self.app_font)
                 timestamp_btn.pack(side="right", padx=5, pady=5)
@@ -210,18 +488,16 @@ class REMBIGUI:
                 entry = tk.Entry(parent, font=self.app_font)
                 entry.grid(row=self.row_counter, column=1, padx=5, pady=2, sticky="ew")
                 self.entries[label] = entry
+                self._dispatch[label] = (KIND_ENTRY, entry)
                 ToolTip(entry, tooltip_text)
 
             self.row_counter += 1
 
-        # Configure column weights for proper resizing
-        parent.grid_columnconfigure(1, weight=1)
-
         # Add a scrollable, read-only text widget for metadata display
         self.metadata_frame = tk.Frame(parent)
         self.metadata_frame.grid(row=self.row_counter, column=0, columnspan=2, sticky="nsew", padx=5, pady=(0, 10))
 
-        tk.Label(self.metadata_frame, text="Extracted Image Metadata:").pack(anchor="w")
+        ttk.Label(self.metadata_frame, text="Extracted Image Metadata:").pack(anchor="w")
 
         self.metadata_text = tk.Text(self.metadata_frame, height=8, width=80, wrap="none", state="disabled")  # Reduced height
         self.metadata_text.pack(side="left", fill="both", expand=True)
@@ -236,6 +512,9 @@ class REMBIGUI:
         loadfields_frame = tk.Frame(parent)
         loadfields_frame.grid(row=self.row_counter + 1, column=0, columnspan=2, pady=(0, 5))
         tk.Button(loadfields_frame, text="Load Fields from Image File", command=self.load_fields_from_image, font=self.app_font).pack(side="left", padx=5)
+        # Empty fields are left out of the ReadMe unless ticked, e.g. to save a blank template
+        self.include_empty_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(loadfields_frame, text="Include empty fields in ReadMe", variable=self.include_empty_var, font=self.app_font).pack(side="left", padx=5)
 
         # Main button row - make buttons smaller for low res
         button_frame = tk.Frame(parent)
@@ -243,7 +522,7 @@ class REMBIGUI:
 
         # Create buttons in a more compact layout
         buttons = [
-            ("Generate ReadMe.txt", self.generate_readme),
+            ("Generate ReadMe.txt", lambda: self.generate_readme(self.include_empty_var.get())),
             ("Load ReadMe.txt", self.load_existing),
             ("Clear Form", self.clear_form),
             ("Help", self.show_help),
@@ -254,8 +533,7 @@ class REMBIGUI:
         ]
         
         # Arrange buttons in two rows if screen is narrow
-        screen_width = self.root.winfo_screenwidth()
-        if screen_width < 1366:  # Small screen
+        if self._screen_width < 1366:  # Small screen
             # First row
             row1_frame = tk.Frame(button_frame)
             row1_frame.pack(pady=2)
@@ -272,9 +550,13 @@ class REMBIGUI:
             for text, command in buttons:
                 tk.Button(button_frame, text=text, command=command, font=self.app_font).pack(side="left", padx=5)
 
-        version_label = tk.Label(parent, text=f"{APP_VERSION}  —  {APP_DATE}", fg="gray")
+        version_label = ttk.Label(parent, text=f"{APP_VERSION}  —  {APP_DATE}", foreground="gray")
         version_label.grid(row=self.row_counter + 3, column=0, columnspan=2, pady=(0, 5))
 
+        # "Other" fields are added on demand in the rows after the version label, one reserved row per combobox
+        first_other_row = self.row_counter + 4
+        self._other_row_for = {label: first_other_row + i for i, label in enumerate(other_labels)}
+
     def setup_scrollable_window(self):
         """Create a scrollable main window for low resolution screens"""
         # Create main canvas and scrollbar
@@ -282,11 +564,9 @@ class REMBIGUI:
         self.scrollbar = tk.Scrollbar(self.root, orient="vertical", command=self.main_canvas.yview)
         self.scrollable_frame = tk.Frame(self.main_canvas)
 
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-        )
+        # Configure scrolling; bursts of <Configure> events (e.g. while the form is built) share one bbox update
+        self._scrollregion_pending = False
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion_update)
 
         self.main_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.main_canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -306,12 +586,47 @@ class REMBIGUI:
         # Update the root reference for form building
         self.form_root = self.scrollable_frame
 
-    def generate_readme(self):
+    def _schedule_scrollregion_update(self, event=None):
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.root.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scrollregion_pending = False
+        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+
+    def _get_value(self, label):
+        """Return the current value of a form field."""
+        kind, widget = self._dispatch[label]
+        if kind == KIND_TEXT:
+            # An empty Text widget ends at 1.0, so skip copying its contents out of Tcl
+            if widget.index("end-1c") == "1.0":
+                return ""
+            # end-1c leaves out the newline Tk always appends; strip() still trims what the user typed
+            return widget.get("1.0", "end-1c").strip()
+        return widget.get()
+
+    def _apply_value(self, label, value):
+        """Replace the value of a form field; labels without a field are ignored."""
+        field = self._dispatch.get(label)
+        if field is None:
+            return
+        kind, widget = field
+        if kind == KIND_VAR:
+            widget.set(value)
+        elif kind == KIND_ENTRY:
+            widget.delete(0, tk.END)
+            widget.insert(0, value)
+        else:
+            _bulk_set_text(widget, value)
+
+    def generate_readme(self, include_empty=False):
+        """Save the form as a ReadMe; empty fields are left out unless include_empty is set."""
         # Get experiment name for filename
         experiment_name = self.entries["Experiment name"].get().strip()
         if experiment_name:
             # Clean filename (remove invalid characters)
-            clean_name = "".join(c for c in experiment_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            clean_name = _FILENAME_STRIP_RE.sub("", experiment_name).rstrip()
             default_filename = f"{clean_name}_ReadME.txt"
         else:
             default_filename = "ReadME.txt"
@@ -322,33 +637,52 @@ class REMBIGUI:
                                                  title="Save ReadMe.txt as")
         if not save_path:
             return
-        if os.path.exists(save_path):
-            if not messagebox.askyesno("Overwrite?", "This file already exists. Overwrite?"):
-                return
-
-        lines = [f"# Generated by {APP_VERSION} — {APP_AUTHOR}, {APP_DATE}", ""]
-        for label, _, _ in self.fields:
-            if label in self.text_fields:
-                value = self.text_fields[label].get("1.0", tk.END).strip()
-                lines.append(f"{label}:\n---\n{value}\n---")
-            elif isinstance(self.entries[label], tk.StringVar):
-                lines.append(f"{label}: {self.entries[label].get()}")
-            else: 
-                lines.append(f"{label}: {self.entries[label].get()}")
+
+        # Stream the ReadMe into one buffer; every line after the header starts with its newline
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Generated by {APP_VERSION} — {APP_AUTHOR}, {APP_DATE}\n")
+        for label, _, _ in FIELDS:
+            value = self._get_value(label)
+            if value or include_empty:
+                write("\n")
+                write(label)
+                if self._dispatch[label][0] == KIND_TEXT:
+                    write(":\n---\n")
+                    write(value)
+                    write("\n---")
+                else:
+                    write(": ")
+                    write(value)
             if label in self.extra_fields:
-                lines.append(f"{label} (Other): {self.extra_fields[label].get()}")
+                other_value = self.extra_fields[label].get()
+                if other_value or include_empty:
+                    write("\n")
+                    write(label)
+                    write(" (Other): ")
+                    write(other_value)
 
         # --- Append metadata if available ---
         if hasattr(self, "last_metadata_output") and self.last_metadata_output:
-            lines.append("\n# Extracted Image Metadata")
-            for k, v in self.last_metadata_output.items():
-                if isinstance(v, list):
-                    v = ", ".join(str(i) for i in v)
-                lines.append(f"{k}: {v}")
-
+            # The panel already formatted this dict when it was shown; only re-format if it has changed since
+            shown, listing = self._metadata_listing
+            if shown is not self.last_metadata_output:
+                listing = _format_metadata(self.last_metadata_output)
+            write("\n\n# Extracted Image Metadata\n")
+            write(listing[:-1])
+
+        # Encode once and write the whole ReadMe in a single call, without text-mode newline translation
+        payload = buf.getvalue().encode("utf-8")
         try:
-            with open(save_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
+            # Exclusive create doubles as the existence check, so only an existing file costs a second open
+            try:
+                f = open(save_path, "xb")
+            except FileExistsError:
+                if not messagebox.askyesno("Overwrite?", "This file already exists. Overwrite?"):
+                    return
+                f = open(save_path, "wb")
+            with f:
+                f.write(payload)
             messagebox.showinfo("Success", "ReadMe.txt generated successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Could not write file: {e}")
@@ -357,87 +691,43 @@ class REMBIGUI:
         path = filedialog.askopenfilename(title="Select existing ReadMe.txt", filetypes=[("Text files", "*.txt")])
         if not path:
             return
-        self.parse_readme_file(path)
+        self.parse_readme_file(path, clear_first=True)
 
     def clear_form(self):
-        for label, widget in self.entries.items():
-            if label in self.text_fields:
-                widget.delete("1.0", tk.END)
-            elif isinstance(widget, tk.StringVar):
-                widget.set("")
-            else:
-                widget.delete(0, tk.END)
-
-        for extra in list(self.extra_fields.values()):
-            extra.destroy()
+        for label in self._dispatch:
+            self._apply_value(label, "")
+
+        # Hide the "(Other)" rows rather than destroying them, so choosing Other again reuses the same, now empty, widgets
+        for label, entry in self.extra_fields.items():
+            entry.grid_remove()
+            self.extra_labels[label].grid_remove()
+            self.hidden_extra_fields[label] = entry
         self.extra_fields.clear()
+        for entry in self.hidden_extra_fields.values():
+            entry.delete(0, tk.END)
 
         # Clear the Extracted Image Metadata box
         self.metadata_text.config(state="normal")
         self.metadata_text.delete("1.0", tk.END)
         self.metadata_text.config(state="disabled")
 
-    def parse_readme_file(self, path):
+    def parse_readme_file(self, path, use_cache=False, clear_first=False):
+        """Fill the form from a ReadMe; with clear_first, fields the file leaves out are blanked once it has parsed."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            if use_cache:
+                fields, extracted_metadata = _read_template_cached(path)
+            else:
+                fields, extracted_metadata = _parse_readme(Path(path).read_text(encoding="utf-8"))
 
-            idx = 0
-            extracted_metadata = {}  # Store extracted metadata separately
-            
-            while idx < len(lines):
-                line = lines[idx].strip()
-                if line.startswith("#") or not line:
-                    idx += 1
-                    continue
-                    
-                # Check if we've reached the "Extracted Image Metadata" section
-                if line == "# Extracted Image Metadata":
-                    idx += 1
-                    # Parse all the metadata lines that follow
-                    while idx < len(lines):
-                        metadata_line = lines[idx].strip()
-                        if metadata_line and ": " in metadata_line:
-                            key, value = metadata_line.split(": ", 1)
-                            # Convert comma-separated values back to lists where appropriate
-                            if ", " in value and key in ["Channel Names", "Acquisition Modes"]:
-                                extracted_metadata[key] = value.split(", ")
-                            else:
-                                extracted_metadata[key] = value
-                        idx += 1
-                    break  # We've processed all metadata
-                    
-                # Handle multi-line fields (like Notes)
-                if line.endswith(":") and idx + 1 < len(lines) and lines[idx + 1].strip() == "---":
-                    label = line[:-1].strip()
-                    idx += 2
-                    value_lines = []
-                    while idx < len(lines) and lines[idx].strip() != "---":
-                        value_lines.append(lines[idx].rstrip("\n"))
-                        idx += 1
-                    value = "\n".join(value_lines)
-                    idx += 1
-                else:
-                    # Handle single-line fields
-                    if ": " not in line:
-                        idx += 1
-                        continue
-                    label, value = line.split(": ", 1)
-                    label = label.strip()
-                    value = value.strip()
-                    idx += 1
-
-                # Populate the form fields (existing logic)
-                if label in self.text_fields:
-                    self.text_fields[label].delete("1.0", tk.END)
-                    self.text_fields[label].insert("1.0", value)
-                elif label in self.entries:
-                    widget = self.entries[label]
-                    if isinstance(widget, tk.StringVar):
-                        widget.set(value)
-                    elif isinstance(widget, tk.Entry):
-                        widget.delete(0, tk.END)
-                        widget.insert(0, value)
+            if clear_first:
+                # Saved ReadMes leave empty fields out; only touch fields that still hold something
+                present = {label for label, _ in fields}
+                for label in self._dispatch:
+                    if label not in present and self._get_value(label):
+                        self._apply_value(label, "")
+
+            for label, value in fields:
+                self._apply_value(label, value)
 
             # If we found extracted metadata, reload it into the metadata panel
             if extracted_metadata:
@@ -453,12 +743,18 @@ class REMBIGUI:
             messagebox.showerror("Error", f"Could not load file: {e}")
 
     def select_and_load_template(self):
-        template_files = glob.glob("*_ReadME_template.txt")
+        # One scandir pass over the working directory; DirEntry already knows which names are files
+        try:
+            with os.scandir(".") as it:
+                template_files = sorted(entry.name for entry in it
+                                        if os.path.normcase(entry.name).endswith(TEMPLATE_SUFFIX) and entry.is_file())
+        except OSError:
+            return
         if not template_files:
             return
 
         def load_template_and_close(fname):
-            self.parse_readme_file(fname)
+            self.parse_readme_file(fname, use_cache=True)
             popup.destroy()
 
         popup = tk.Toplevel(self.root)
@@ -481,81 +777,23 @@ class REMBIGUI:
 
 
     def show_help(self):
-        help_window = tk.Toplevel(self.root)
+        # The help page never changes, so build it once and re-show the same window afterwards
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+
+        help_window = self._help_window = tk.Toplevel(self.root)
         help_window.title("Help / Info")
         help_window.geometry("1000x650")  # Made taller to accommodate acknowledgements
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
 
         help_text = tk.Text(help_window, wrap="word", font=("Segoe UI", 10), width=80, height=35)
         help_text.pack(expand=True, fill="both", padx=10, pady=10)
 
-        help_text.insert("1.0", "📄 ReMInD - Recommended Metadata Interface for Documentation Help\n\n", "title")
-        help_text.insert("end", "This tool was created by Nicholas Condon (UQ) from IMB Microscopy in 2025.\n\n")
-        help_text.insert("end", "The purpose of this tool is to help capture additional metadata to store with your RAW experimental data.\n\n")
-        
-        help_text.insert("end", "✒️ Entering Information \n", "subtitle")
-        help_text.insert("end", "\t• Not every field needs to be filled in.\n")
-        help_text.insert("end", "\t• If the tool can detect UQ-InstGateway then a list of available RDMs will be shown, if not connected it will warn you and allow free text input.\n")
-        help_text.insert("end", "\t• Hover your cursor over the text box for more description for the field.\n")
-        help_text.insert("end", "\t• Some fields contain drop down lists you can choose items from, if choosing 'other' provide the information in the notes box.\n")
-        help_text.insert("end", "\t• The notes box can be filled in with as much detail as possible. You can use the 'Timestamp' button to generate a new line with the date and time.\n\n")
-        
-        help_text.insert("end", "🔬 Load Fields from Image File \n", "subtitle")
-        help_text.insert("end", "\t• Click 'Load Fields from Image File' to automatically extract metadata from your image files.\n")
-        help_text.insert("end", "\t• Supported formats: CZI (Zeiss), LIF (Leica), and ND2 (Nikon) files.\n")
-        help_text.insert("end", "\t• The tool will automatically populate relevant fields with metadata from the image file including:\n")
-        help_text.insert("end", "\t\t- Date and time of acquisition\n")
-        help_text.insert("end", "\t\t- Microscope name and settings\n")
-        help_text.insert("end", "\t\t- Objective lens information\n")
-        help_text.insert("end", "\t\t- Channel information\n")
-        help_text.insert("end", "\t\t- Imaging parameters (Z-stack, time series)\n")
-        help_text.insert("end", "\t\t- Software and system information\n")
-        help_text.insert("end", "\t• Extracted metadata will be displayed in the 'Extracted Image Metadata' section.\n")
-        help_text.insert("end", "\t• You can review and edit the imported information before generating your ReadMe file.\n")
-        help_text.insert("end", "\t• The raw metadata is also included when exporting as JSON or generating ReadMe files.\n\n")
-        
-        help_text.insert("end", "💾 Generate ReadMe.txt\n", "subtitle")
-        help_text.insert("end", "\t• Once you have filled in the form to your liking you can save a ReadMe.txt file to any location (ideally within the data folder it's associated with).\n")
-        help_text.insert("end", "\t• Save the ReadMe.txt file alongside the captured data.\n")
-        help_text.insert("end", "\t• Use a filename that includes 'ReadMe' and the experiment name if needed.\n")
-        help_text.insert("end", "\t• If you imported metadata from an image file, the raw metadata will be appended to the ReadMe file.\n\n")
-        
-        help_text.insert("end", "📂 Load ReadMe.txt\n", "subtitle")
-        help_text.insert("end", "\t• The program has the ability to read a previously generated ReadMe file and repopulate the fields for quick editing/updating.\n")
-        help_text.insert("end", "\t• This can be particularly useful when adding to the notes section.\n\n")
-        
-        help_text.insert("end", "📖 Templates \n", "subtitle")
-        help_text.insert("end", "\t• The program automatically looks for any template files stored in the same location as the executable.\n")
-        help_text.insert("end", "\t• Any template file must be saved as *_ReadMe_template.txt with something in place of the *.\n")
-        help_text.insert("end", "\t• Multiple templates can be handled with a popup on startup allowing you to choose from a template or skip.\n\n")
-        
-        help_text.insert("end", "📁 Export as JSON\n", "subtitle")
-        help_text.insert("end", "\t• Export all form data and extracted metadata as a structured JSON file.\n")
-        help_text.insert("end", "\t• Useful for data processing, analysis workflows, or integration with other tools.\n")
-        help_text.insert("end", "\t• Includes both form entries and raw extracted image metadata.\n\n")
-        
-        help_text.insert("end", "📌 Tips:\n", "subtitle")
-        help_text.insert("end", "\t• Use a previously generated ReadMe.txt file as a template to pre-load certain fields such as RDM Info, Name, Sample information etc.\n")
-        help_text.insert("end", "\t• If you're iterating on an experiment, consider labeling your files like ReadMe_exp1_v1.txt, v2, etc.\n")
-        help_text.insert("end", "\t• Be descriptive: When entering experiment details, use full names, reagent IDs, microscope configurations, etc.\n")
-        help_text.insert("end", "\t• Always load metadata from your original image files first, then supplement with additional information.\n")
-        help_text.insert("end", "\t• Review imported metadata for accuracy - some fields may need manual correction or additional detail.\n")
-        help_text.insert("end", "\t• Use the metadata extraction feature to ensure consistency across multiple experiments.\n\n")
-
-        help_text.insert("end", "🙏 Acknowledgements\n", "subtitle")
-        help_text.insert("end", "This tool uses several open-source libraries for metadata extraction:\n\n")
-        help_text.insert("end", "\t• czifile by Christoph Gohlke - For reading Zeiss CZI files\n")
-        help_text.insert("end", "\t\t  https://github.com/cgohlke/czifile\n\n")
-        help_text.insert("end", "\t• readlif by Nimesh Khadka - For reading Leica LIF files\n")
-        help_text.insert("end", "\t\t  https://github.com/nimne/readlif\n\n")
-        help_text.insert("end", "\t• nd2 by Talley Lambert - For reading Nikon ND2 files\n")
-        help_text.insert("end", "\t\t  https://github.com/tlambert03/nd2\n\n")
-        help_text.insert("end", "\t• Python standard libraries: tkinter, json, datetime, os, glob\n\n")
-        help_text.insert("end", "Special thanks to the open-source community for making microscopy metadata\n")
-        help_text.insert("end", "accessible and standardized across different imaging platforms.\n\n")
-        help_text.insert("end", "For support or feature requests, contact IMB Microscopy at The University of Queensland.")
-
         help_text.tag_configure("title", font=("Segoe UI", 12, "bold"))
         help_text.tag_configure("subtitle", font=("Segoe UI", 10, "bold"))
+        help_text.insert("1.0", *(part for segment in HELP_TEXT for part in segment))
         help_text.config(state="disabled")
 
 
@@ -572,68 +810,96 @@ class REMBIGUI:
             return
 
         ext = os.path.splitext(path)[1].lower()
+        if ext not in (".czi", ".lif", ".nd2"):
+            messagebox.showinfo("Not Supported", "Only CZI, LIF, and ND2 files are supported for metadata extraction at this time.")
+            return
+
+        # Re-loading an unchanged file reuses the earlier result instead of reading it again
+        try:
+            stat = os.stat(path)
+            cache_key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            self._metadata_cache.move_to_end(cache_key)
+            self._apply_image_metadata(ext, cached, None)
+            return
+
+        # Reading a large image file can take a while, so extract on a worker thread and
+        # poll for the result from the Tk event loop to keep the window responsive
+        results = queue.Queue(maxsize=1)
+
+        def worker():
+            try:
+                results.put((self._read_image_metadata(path, ext), None))
+            except Exception as e:
+                results.put((None, e))
+
+        self.root.config(cursor="watch")
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(50, self._poll_image_metadata, results, ext, cache_key)
+
+    def _read_image_metadata(self, path, ext):
+        """Run the extractor for ext; this runs on a worker thread, so it must not touch any widgets."""
+        if ext == ".czi":
+            from metadata_extractors.CZI_MetadataGUI import extract_metadata
+            return extract_metadata(path)
+        if ext == ".lif":
+            from metadata_extractors.LIF_MetadataGUI import extract_lif_metadata
+            return extract_lif_metadata(path)
+        from metadata_extractors.Nd2_v2a import extract_nd2_metadata
+        return extract_nd2_metadata(path)
+
+    def _poll_image_metadata(self, results, ext, cache_key):
+        try:
+            result, error = results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_image_metadata, results, ext, cache_key)
+            return
+        self.root.config(cursor="")
+        if error is None and cache_key is not None:
+            self._metadata_cache[cache_key] = result
+            if len(self._metadata_cache) > METADATA_CACHE_SIZE:
+                self._metadata_cache.popitem(last=False)
+        self._apply_image_metadata(ext, result, error)
+
+    def _fill_from_field_map(self, metadata_output, ext, source_tag):
+        """Fill the form fields listed in IMAGE_FIELD_MAP from a CZI or LIF summary dict."""
+        for remind_label, source_key in IMAGE_FIELD_MAP:
+            if source_key is None:
+                if remind_label == "Image format":
+                    self._apply_value(remind_label, ext)
+                elif remind_label == "Notes":
+                    notes_widget = self.text_fields.get("Notes")
+                    if notes_widget:
+                        notes_widget.insert(tk.END, f"\n[Imported from {source_tag}]\n")
+                continue
+
+            value = metadata_output.get(source_key, "")
+            # Special handling for Imaging mode (Acquisition Modes)
+            if remind_label == "Imaging mode":
+                if isinstance(value, list) and value:
+                    value = str(value[0])  # Use only the first value
+                elif isinstance(value, list):
+                    value = ""
+            else:
+                value = _format_value(value)
+            self._apply_value(remind_label, value)
+
+    def _apply_image_metadata(self, ext, result, error):
+        """Fill the form from an extractor result, or report the error it raised."""
         if ext == ".czi":
             try:
-                metadata_output, _ = extract_metadata(path)
-
-                # Map CZI metadata keys to ReMInD form fields
-                field_map = {
-                    "Experiment name": None,  # Do not auto-fill from file name
-                    "Date and time": "Document Creation Date",
-                    "Experimentor Name(s)": "Document User Name",
-                    "Microscope name": "System Name",
-                    "Objective": "Objective Model",
-                    "Immersion": "Objective Medium",
-                    "Imaging mode": "Acquisition Modes",
-                    "Channel info": "Channel Names",
-                    "Image format": None,
-                    "Notes": None,
-                }
-
-                for remind_label, czi_key in field_map.items():
-                    if czi_key is None:
-                        if remind_label == "Image format":
-                            widget = self.entries[remind_label]
-                            if isinstance(widget, tk.StringVar):
-                                widget.set(ext)
-                            else:
-                                widget.delete(0, tk.END)
-                                widget.insert(0, ext)
-                        elif remind_label == "Notes":
-                            notes_widget = self.text_fields.get("Notes")
-                            if notes_widget:
-                                notes_widget.insert(tk.END, "\n[Imported from CZI]\n")
-                        continue
+                if error is not None:
+                    raise error
+                metadata_output, _ = result
 
-                    value = metadata_output.get(czi_key, "")
-                    # Special handling for Imaging mode (Acquisition Modes)
-                    if remind_label == "Imaging mode":
-                        if isinstance(value, list) and value:
-                            value = str(value[0])  # Use only the first value
-                        elif isinstance(value, list):
-                            value = ""
-                    elif isinstance(value, list):
-                        value = ", ".join(str(v) for v in value)
-                    widget = self.entries.get(remind_label)
-                    if widget is None:
-                        continue
-                    if isinstance(widget, tk.StringVar):
-                        widget.set(value)
-                    elif isinstance(widget, tk.Entry):
-                        widget.delete(0, tk.END)
-                        widget.insert(0, value)
-                    elif remind_label == "Notes" and remind_label in self.text_fields:
-                        self.text_fields[remind_label].insert(tk.END, value)
+                self._fill_from_field_map(metadata_output, ext, "CZI")
 
                 # If DataSourceTypeName is Confocal, set Imaging mode to Confocal
                 if metadata_output.get("DataSourceTypeName", "").lower() == "confocal":
-                    imaging_mode_widget = self.entries.get("Imaging mode")
-                    if imaging_mode_widget:
-                        if isinstance(imaging_mode_widget, tk.StringVar):
-                            imaging_mode_widget.set("Confocal")
-                        elif isinstance(imaging_mode_widget, tk.Entry):
-                            imaging_mode_widget.delete(0, tk.END)
-                            imaging_mode_widget.insert(0, "Confocal")
+                    self._apply_value("Imaging mode", "Confocal")
 
                 self.show_metadata_in_window(metadata_output)
                 self.last_metadata_output = metadata_output  # Store for later use
@@ -644,56 +910,14 @@ class REMBIGUI:
                 messagebox.showerror("Error", f"Failed to extract CZI metadata:\n{e}")
         elif ext == ".lif":
             try:
-                metadata_list = extract_lif_metadata(path)
+                if error is not None:
+                    raise error
+                metadata_list = result
                 if not metadata_list:
                     messagebox.showerror("Error", "No images found in LIF file.")
                     return
                 metadata_output = metadata_list[0]  # Use first image/series
-                # Map LIF metadata keys to ReMInD form fields
-                field_map = {
-                    "Experiment name": None,
-                    "Date and time": "Document Creation Date",
-                    "Experimentor Name(s)": "Document User Name",
-                    "Microscope name": "System Name",
-                    "Objective": "Objective Model",
-                    "Immersion": "Objective Medium",
-                    "Imaging mode": "Acquisition Modes",
-                    "Channel info": "Channel Names",
-                    "Image format": None,
-                    "Notes": None,
-                }
-                for remind_label, lif_key in field_map.items():
-                    if lif_key is None:
-                        if remind_label == "Image format":
-                            widget = self.entries[remind_label]
-                            if isinstance(widget, tk.StringVar):
-                                widget.set(ext)
-                            else:
-                                widget.delete(0, tk.END)
-                                widget.insert(0, ext)
-                        elif remind_label == "Notes":
-                            notes_widget = self.text_fields.get("Notes")
-                            if notes_widget:
-                                notes_widget.insert(tk.END, "\n[Imported from LIF]\n")
-                        continue
-                    value = metadata_output.get(lif_key, "")
-                    if remind_label == "Imaging mode":
-                        if isinstance(value, list) and value:
-                            value = str(value[0])
-                        elif isinstance(value, list):
-                            value = ""
-                    elif isinstance(value, list):
-                        value = ", ".join(str(v) for v in value)
-                    widget = self.entries.get(remind_label)
-                    if widget is None:
-                        continue
-                    if isinstance(widget, tk.StringVar):
-                        widget.set(value)
-                    elif isinstance(widget, tk.Entry):
-                        widget.delete(0, tk.END)
-                        widget.insert(0, value)
-                    elif remind_label == "Notes" and remind_label in self.text_fields:
-                        self.text_fields[remind_label].insert(tk.END, value)
+                self._fill_from_field_map(metadata_output, ext, "LIF")
 
                 self.show_metadata_in_window(metadata_output)
                 self.last_metadata_output = metadata_output  # Store for later use
@@ -704,24 +928,18 @@ class REMBIGUI:
                 messagebox.showerror("Error", f"Failed to extract LIF metadata:\n{e}")
         elif ext == ".nd2":
             try:
-                # Extract ND2 metadata using your new functions
-                metadata_output = extract_nd2_metadata(path)
+                if error is not None:
+                    raise error
+                from metadata_extractors.Nd2_v2a import map_nd2_to_remind_fields
+                metadata_output = result
                 remind_fields = map_nd2_to_remind_fields(metadata_output)
                 
                 # Map ND2 metadata to ReMInD form fields
                 for remind_label, value in remind_fields.items():
                     if not value or remind_label == "Notes":  # Skip empty values and Notes
                         continue
-                        
-                    widget = self.entries.get(remind_label)
-                    if widget is None:
-                        continue
-                        
-                    if isinstance(widget, tk.StringVar):
-                        widget.set(value)
-                    elif isinstance(widget, tk.Entry):
-                        widget.delete(0, tk.END)
-                        widget.insert(0, value)
+                    # Labels the form does not have (e.g. Software) are ignored by _apply_value
+                    self._apply_value(remind_label, value)
 
                 # Special handling for Notes field to add import info only
                 notes_widget = self.text_fields.get("Notes")
@@ -736,17 +954,14 @@ class REMBIGUI:
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to extract ND2 metadata:\n{e}")
-                
-        else:
-            messagebox.showinfo("Not Supported", "Only CZI, LIF, and ND2 files are supported for metadata extraction at this time.")
 
     def show_metadata_in_window(self, metadata_dict):
+        # Build the whole listing first so the Text widget gets a single insert, and keep it for generate_readme
+        listing = _format_metadata(metadata_dict)
+        self._metadata_listing = (metadata_dict, listing)
         self.metadata_text.config(state="normal")
         self.metadata_text.delete("1.0", tk.END)
-        for k, v in metadata_dict.items():
-            if isinstance(v, list):
-                v = ", ".join(str(i) for i in v)
-            self.metadata_text.insert(tk.END, f"{k}: {v}\n")
+        self.metadata_text.insert(tk.END, listing)
         self.metadata_text.config(state="disabled")
 
     def toggle_dark_mode(self):
@@ -757,12 +972,14 @@ class REMBIGUI:
         highlight = "#444"
 
         style = ttk.Style()
+        # Use clam theme for better dark combobox support; switching themes restyles every ttk widget,
+        # so only do it the first time rather than on every toggle
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
         if not hasattr(self, "dark_mode") or not self.dark_mode:
             self.root.configure(bg=dark_bg)
             for widget in self.root.winfo_children():
                 self._set_widget_dark(widget, dark_bg, dark_fg, entry_bg, entry_fg, highlight)
-            # Use clam theme for better dark combobox support
-            style.theme_use('clam')
             style.configure("TCombobox",
                             fieldbackground=entry_bg,
                             background=entry_bg,
@@ -774,7 +991,6 @@ class REMBIGUI:
             self.root.configure(bg="SystemButtonFace")
             for widget in self.root.winfo_children():
                 self._set_widget_light(widget)
-            style.theme_use('clam')
             style.configure("TCombobox",
                             fieldbackground="white",
                             background="white",
@@ -788,7 +1004,8 @@ class REMBIGUI:
         if cls in ["Frame", "LabelFrame"]:
             widget.configure(bg=bg)
         elif cls == "Label":
-            widget.configure(bg=bg, fg=fg)
+            # Form labels are ttk.Label, which only takes the long option names
+            widget.configure(background=bg, foreground=fg)
         elif cls == "Entry":
             widget.configure(bg=entry_bg, fg=entry_fg, insertbackground=entry_fg)
         elif cls == "Text":
@@ -809,7 +1026,7 @@ class REMBIGUI:
         if cls in ["Frame", "LabelFrame", "Toplevel"]:
             widget.configure(bg="SystemButtonFace")
         elif cls == "Label":
-            widget.configure(bg="SystemButtonFace", fg="black")
+            widget.configure(background="SystemButtonFace", foreground="black")
         elif cls == "Entry":
             widget.configure(bg="white", fg="black", insertbackground="black")
         elif cls == "Text":
@@ -835,14 +1052,8 @@ class REMBIGUI:
 
     def export_as_json(self):
         data = {}
-        for label, _, _ in self.fields:
-            if label in self.text_fields:
-                value = self.text_fields[label].get("1.0", tk.END).strip()
-                data[label] = value
-            elif isinstance(self.entries[label], tk.StringVar):
-                data[label] = self.entries[label].get()
-            else:
-                data[label] = self.entries[label].get()
+        for label, _, _ in FIELDS:
+            data[label] = self._get_value(label)
             if label in self.extra_fields:
                 data[f"{label} (Other)"] = self.extra_fields[label].get()
 
@@ -854,7 +1065,7 @@ class REMBIGUI:
         experiment_name = self.entries["Experiment name"].get().strip()
         if experiment_name:
             # Clean filename (remove invalid characters)
-            clean_name = "".join(c for c in experiment_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            clean_name = _FILENAME_STRIP_RE.sub("", experiment_name).rstrip()
             default_filename = f"{clean_name}_metadata.json"
         else:
             default_filename = "metadata.json"
@@ -866,8 +1077,12 @@ class REMBIGUI:
         if not save_path:
             return
         try:
-            with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, indent=2).encode("utf-8")
+            with open(save_path, "wb") as f:
+                f.write(payload)
             messagebox.showinfo("Success", "Metadata exported as JSON successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Could not write JSON file: {e}")
@@ -18,11 +18,14 @@ def safe_round(val):
 
 def round_list(lst):
     """Round all numeric values in a list to 3 decimals, leave others unchanged."""
-    return [
-        round(float(x), 3) if isinstance(x, (int, float)) or (isinstance(x, str) and x.replace('.', '', 1).replace('-', '', 1).isdigit())
-        else x
-        for x in lst
-    ]
+    rounded = []
+    append = rounded.append
+    for x in lst:
+        try:
+            append(round(float(x), 3))
+        except (TypeError, ValueError):
+            append(x)
+    return rounded
 
 def to_microns(val):
     """Convert a value in meters to microns, rounded to 3 decimals."""
@@ -38,113 +41,172 @@ def to_int(val):
     except Exception:
         return val
 
-def extract_metadata(demo_czi_read):
-    """Extract and return filtered and full metadata from a CZI file."""
+def to_float(val):
+    """Convert a value to float if possible, else return as is."""
+    try:
+        return float(val)
+    except Exception:
+        return val
+
+# Element paths into the CZI metadata XML, relative to the ImageDocument root.
+# ElementTree caches each compiled path, so these are only parsed once per process.
+_INFO_PATH = "Metadata/Information"
+_IMAGE_PATH = "Metadata/Information/Image"
+_INSTRUMENT_PATH = "Metadata/Information/Instrument"
+_ACQUISITION_BLOCK_PATH = "Metadata/Experiment/ExperimentBlocks/AcquisitionBlock"
+_DEVICE_PATH = "Metadata/HardwareSetting/Configuration/Device"
+_SCALING_ITEMS_PATH = "Metadata/Scaling/Items"
+_CHANNEL_PATH = "Dimensions/Channels/Channel"
+_CHANNEL_REF_PATH = "Dimensions/Tracks/Track/ChannelRefs/ChannelRef"
+_DETECTOR_PATH = "MultiTrackSetup/TrackSetup/Detectors/Detector"
+
+# Output fields in display order. Fields with a path are read straight from the XML (relative to the
+# ImageDocument root) through their converter; fields without one are computed in extract_metadata.
+_OUTPUT_FIELDS = (
+    ("Document Name", None, None),
+    ("Document User Name", _INFO_PATH + "/Document/UserName", str),
+    ("Document Creation Date", _INFO_PATH + "/Document/CreationDate", str),
+    ("Application Name", _INFO_PATH + "/Application/Name", str),
+    ("Application Version", _INFO_PATH + "/Application/Version", str),
+    ("System Name", None, None),
+    ("Pixel Type", _IMAGE_PATH + "/PixelType", str),
+    ("Size X", _IMAGE_PATH + "/SizeX", to_int),
+    ("Size Y", _IMAGE_PATH + "/SizeY", to_int),
+    ("Size Z", _IMAGE_PATH + "/SizeZ", to_int),
+    ("Size M", _IMAGE_PATH + "/SizeM", to_int),
+    ("Size T", _IMAGE_PATH + "/SizeT", to_int),
+    ("Size C", None, None),
+    ("Size S", _IMAGE_PATH + "/SizeS", to_int),
+    ("Pixel Size X (um)", None, None),
+    ("Pixel Size Y (um)", None, None),
+    ("Pixel Size Z (um)", None, None),
+    ("Image Size X (um)", None, None),
+    ("Image Size Y (um)", None, None),
+    ("Image Size Z (um)", None, None),
+    ("Time Interval (s)", _ACQUISITION_BLOCK_PATH + "/SubDimensionSetups/TimeSeriesSetup/Interval/TimeSpan/Value", to_float),
+    ("Objective Model", _INSTRUMENT_PATH + "/Objectives/Objective/Manufacturer/Model", str),
+    ("Objective NA", _INSTRUMENT_PATH + "/Objectives/Objective/LensNA", safe_round),
+    ("Objective Magnification", _INSTRUMENT_PATH + "/Objectives/Objective/NominalMagnification", safe_round),
+    ("Objective Refractive Index", _IMAGE_PATH + "/ObjectiveSettings/RefractiveIndex", safe_round),
+    ("Objective Medium", _IMAGE_PATH + "/ObjectiveSettings/Medium", str),
+    ("Illumination_Types", None, None),
+    ("Contrast Methods", None, None),
+    ("Acquisition Modes", None, None),
+    ("Channel Names", None, None),
+    ("Dye Names", None, None),
+    ("Excitation Wavelengths", None, None),
+    ("Emission Wavelengths", None, None),
+    ("Emission Wavelength Range (nm)", None, None),
+    ("Pinhole Sizes (Airy Units)", None, None),
+    ("Pinhole Diameters (um)", None, None),
+    ("AiryScan Virtual Pinhole Size (um)", None, None),
+    ("Zoom", None, None),
+    ("MM.TotalMagnification (per channel)", None, None),
+)
+
+# Stand-in for missing sections so lookups below fall through to their defaults.
+_EMPTY = ET.Element("Empty")
+
+def _section(node, path):
+    """Return the first element matching path under node, or an empty element."""
+    found = node.find(path)
+    return found if found is not None else _EMPTY
+
+def _element_text(element, default="N/A"):
+    """Return the stripped text of an element, or default if it is missing or empty."""
+    if element is None or element.text is None:
+        return default
+    text = element.text.strip()
+    return text if text else default
+
+def _find_text(node, path, default="N/A"):
+    """Return the stripped text of the element at path under node, or default if missing or empty."""
+    return _element_text(node.find(path), default)
+
+def _index_children(node):
+    """Map each direct child's tag to the first child element with that tag."""
+    return {child.tag: child for child in reversed(node)}
+
+def _match_channel(channel_name, values_by_channel, default="N/A"):
+    """Return the value for a channel name: an exact match first, else the first partial match, else default."""
+    value = values_by_channel.get(channel_name)
+    if value is not None:
+        return value
+    return next(
+        (val for det_channel, val in values_by_channel.items()
+         if det_channel and (det_channel in channel_name or channel_name in det_channel)),
+        default,
+    )
+
+def _element_to_dict(element):
+    """Convert an element into xmltodict-style nested dicts, dropping whitespace-only text."""
+    node = {"@" + name: value for name, value in element.attrib.items()}
+    for child in element:
+        value = _element_to_dict(child)
+        existing = node.get(child.tag)
+        if existing is None and child.tag not in node:
+            node[child.tag] = value
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            node[child.tag] = [existing, value]
+    text = element.text.strip() if element.text else ""
+    if not node:
+        return text or None
+    if text:
+        node["#text"] = text
+    return node
+
+def extract_metadata(demo_czi_read, want_full_dict=False):
+    """Extract and return filtered metadata from a CZI file, plus the full metadata dict if want_full_dict is set (else None)."""
     with pyczi.open_czi(demo_czi_read) as czi_doc:
         root = ET.fromstring(czi_doc.raw_metadata)
-        metadata_dict = czi_doc.metadata
-
-        # --- Helper functions ---
-        def safe_get(d, *keys, default="N/A"):
-            for k in keys:
-                if isinstance(d, dict) and k in d:
-                    d = d[k]
-                else:
-                    return default
-            return d
-
-        def ensure_list(val):
-            if isinstance(val, list):
-                return val
-            elif isinstance(val, dict):
-                return [val]
-            else:
-                return []
+        # The full dict is built from the tree parsed above rather than czi_doc.metadata, which parses the XML again
+        metadata_dict = {root.tag: _element_to_dict(root)} if want_full_dict else None
+
+        # --- Table-driven fields; the computed ones are filled in below, keeping the table's order ---
+        metadata_output = {
+            key: convert(_find_text(root, path)) if path else None
+            for key, path, convert in _OUTPUT_FIELDS
+        }
 
         # --- Metadata navigation ---
-        meta = safe_get(metadata_dict, "ImageDocument", "Metadata", default={})
-        info_meta = safe_get(meta, "Information", default={})
-        config_meta = safe_get(meta, "HardwareSetting", "Configuration", default={})
-        image_meta = safe_get(info_meta, "Image", default={})
-        instrument_meta = safe_get(info_meta, "Instrument", default={})
-        microscope_meta = safe_get(instrument_meta, "Microscopes", default={})
-        objectives_meta = safe_get(instrument_meta, "Objectives", default={})
-        application_meta = safe_get(info_meta, "Application", default={})
-        experiment_meta = safe_get(meta, "Experiment", default={})
-        acquisition_blocks = ensure_list(
-            safe_get(experiment_meta, "ExperimentBlocks", "AcquisitionBlock", default=[])
-        )
-        acquisition_meta = acquisition_blocks[0] if acquisition_blocks else {}
-        track_meta = safe_get(acquisition_meta, "MultiTrackSetup", default={})
+        image_meta = _section(root, _IMAGE_PATH)
+        instrument_meta = _section(root, _INSTRUMENT_PATH)
+        acquisition_meta = _section(root, _ACQUISITION_BLOCK_PATH)
 
         # --- Document info ---
-        document_name = safe_get(info_meta, "Document", "Name", default=os.path.splitext(os.path.basename(demo_czi_read))[0])
-        document_user_name = safe_get(info_meta, "Document", "UserName")
-        document_creation_date = safe_get(info_meta, "Document", "CreationDate")
-
-        # --- Application info ---
-        application_name = safe_get(application_meta, "Name")
-        application_version = safe_get(application_meta, "Version")
+        document_name = _find_text(root, _INFO_PATH + "/Document/Name", default=None)
+        if document_name is None:
+            # Only fall back to (and parse) the file name when the document has no name of its own
+            document_name = os.path.splitext(os.path.basename(demo_czi_read))[0]
+        metadata_output["Document Name"] = document_name
 
         # --- System info ---
-        microscope = safe_get(microscope_meta, "Microscope", default={})
-        system_name = microscope.get("System", "")
-
-        device = config_meta.get("Device", {})
-        widefield_name = ""
-        if isinstance(device, list):
-            widefield_name = next((d.get("@Name", "") for d in device if d.get("@Id") == "Microscope" and "@Name" in d), "")
-            if not widefield_name:
-                widefield_name = next((d.get("@Name", "") for d in device if "@Name" in d), "")
-        elif isinstance(device, dict):
-            widefield_name = device.get("@Name", "")
+        system_name = _find_text(instrument_meta, "Microscopes/Microscope/System", default="")
         if not system_name:
-            system_name = widefield_name
-
-        # --- Image info ---
-        pixel_type = image_meta.get("PixelType", "N/A")
-        size_x = to_int(image_meta.get("SizeX", "N/A"))
-        size_y = to_int(image_meta.get("SizeY", "N/A"))
-        size_z = to_int(image_meta.get("SizeZ", "N/A"))
-        size_t = to_int(image_meta.get("SizeT", "N/A"))
-        size_s = to_int(image_meta.get("SizeS", "N/A"))
-        size_m = to_int(image_meta.get("SizeM", "N/A"))
+            devices = root.findall(_DEVICE_PATH)
+            system_name = next((d.get("Name") for d in devices if d.get("Id") == "Microscope" and "Name" in d.attrib), "")
+            if not system_name:
+                system_name = next((d.get("Name") for d in devices if "Name" in d.attrib), "")
+        metadata_output["System Name"] = system_name
 
         # --- Channel info ---
-        dim_info = safe_get(metadata_dict, "ImageDocument", "Metadata", "Information", "Image", "Dimensions", default={})
-        tracks = ensure_list(dim_info.get("Tracks", {}).get("Track", []))
-        channel_ids = set()
-        for track in tracks:
-            channel_refs = ensure_list(track.get("ChannelRefs", {}).get("ChannelRef", []))
-            for cref in channel_refs:
-                if "@Id" in cref:
-                    channel_ids.add(cref["@Id"])
-        size_c = to_int(len(channel_ids))
-
-        # --- Pixel sizes (microns) ---
-        acq_mode_setup = safe_get(acquisition_meta, "AcquisitionModeSetup", default={})
-        pixel_Size_X = to_microns(acq_mode_setup.get("ScalingX", "N/A"))
-        pixel_Size_Y = to_microns(acq_mode_setup.get("ScalingY", "N/A"))
-        pixel_Size_Z = to_microns(acq_mode_setup.get("ScalingZ", "N/A"))
-
-        # Fallback for pixel sizes
-        scaling_items = safe_get(metadata_dict, "ImageDocument", "Metadata", "Scaling", "Items", default={})
-        distances = ensure_list(scaling_items.get("Distance", []))
-        distance_map = {d.get("@Id"): d.get("Value") for d in distances if "@Id" in d and "Value" in d}
+        channel_ids = {cref.get("Id") for cref in image_meta.iterfind(_CHANNEL_REF_PATH) if "Id" in cref.attrib}
+        metadata_output["Size C"] = to_int(len(channel_ids))
+
+        # --- Pixel sizes (microns), falling back to the document scaling ---
+        scaling_items = _section(root, _SCALING_ITEMS_PATH)
 
         def fallback_pixel_size(val, axis):
             if not val or val == "N/A" or val == 0:
-                v = distance_map.get(axis)
+                v = _find_text(scaling_items, f"Distance[@Id='{axis}']/Value", None)
                 try:
                     return round(float(v) * 1e6, 3)
                 except Exception:
                     return val
             return val
 
-        pixel_Size_X = fallback_pixel_size(pixel_Size_X, "X")
-        pixel_Size_Y = fallback_pixel_size(pixel_Size_Y, "Y")
-        pixel_Size_Z = fallback_pixel_size(pixel_Size_Z, "Z")
-
         # --- Image size in microns ---
         def safe_image_size(size, pixel_size):
             try:
@@ -152,181 +214,82 @@ def extract_metadata(demo_czi_read):
             except Exception:
                 return "N/A"
 
-        image_size_x = safe_image_size(size_x, pixel_Size_X)
-        image_size_y = safe_image_size(size_y, pixel_Size_Y)
-        image_size_z = safe_image_size(size_z, pixel_Size_Z)
-
-        # --- Objective info ---
-        objective = objectives_meta.get("Objective", {})
-        objective_model = safe_get(objective, "Manufacturer", "Model")
-        objective_NA = safe_round(objective.get("LensNA", "N/A"))
-        objective_mag = safe_round(objective.get("NominalMagnification", "N/A"))
-        objective_RI = safe_round(image_meta.get("ObjectiveSettings", {}).get("RefractiveIndex", "N/A"))
-        objective_Medium = image_meta.get("ObjectiveSettings", {}).get("Medium", "N/A")
+        for axis in ("X", "Y", "Z"):
+            pixel_size = to_microns(_find_text(acquisition_meta, "AcquisitionModeSetup/Scaling" + axis))
+            pixel_size = fallback_pixel_size(pixel_size, axis)
+            metadata_output[f"Pixel Size {axis} (um)"] = pixel_size
+            metadata_output[f"Image Size {axis} (um)"] = safe_image_size(metadata_output["Size " + axis], pixel_size)
 
         # --- Channel details ---
-        channels_info = ensure_list(
-            safe_get(metadata_dict, "ImageDocument", "Metadata", "Information", "Image", "Dimensions", "Channels", "Channel", default=[])
-        )
-
+        channels_info = image_meta.findall(_CHANNEL_PATH)
+
+        # Index each channel's children once so every per-channel field below is a dict lookup
+        channel_children = [_index_children(ch) for ch in channels_info]
+
+        channel_names = [ch.get("Name", "N/A") for ch in channels_info]
+        metadata_output["Illumination_Types"] = [_element_text(c.get("IlluminationType")) for c in channel_children]
+        metadata_output["Contrast Methods"] = [_element_text(c.get("ContrastMethod")) for c in channel_children]
+        metadata_output["Acquisition Modes"] = [_element_text(c.get("AcquisitionMode")) for c in channel_children]
+        metadata_output["Channel Names"] = channel_names
+        metadata_output["Dye Names"] = [_element_text(c.get("Fluor")) for c in channel_children]
+        metadata_output["Excitation Wavelengths"] = round_list([_element_text(c.get("ExcitationWavelength")) for c in channel_children])
+        metadata_output["Emission Wavelengths"] = round_list([_element_text(c.get("EmissionWavelength")) for c in channel_children])
+        metadata_output["Pinhole Sizes (Airy Units)"] = round_list([_element_text(c.get("PinholeSizeAiry")) for c in channel_children])
+        metadata_output["Zoom"] = round_list([_find_text(c.get("LaserScanInfo", _EMPTY), "ZoomX") for c in channel_children])
         # Per-channel MM.TotalMagnification
-        total_magnifications = []
-        for ch in channels_info:
-            mm_total_mag = safe_get(ch, "CustomAttributes", "MM.TotalMagnification")
-            try:
-                mm_total_mag = round(float(mm_total_mag), 3)
-            except Exception:
-                pass
-            total_magnifications.append(mm_total_mag)
-
-        channel_names = [ch.get("@Name", "N/A") for ch in channels_info]
-        illumination_Types = [ch.get("IlluminationType", "N/A") for ch in channels_info]
-        contrast_Methods = [ch.get("ContrastMethod", "N/A") for ch in channels_info]
-        pinhole_Sizes = [safe_round(ch.get("PinholeSizeAiry", "N/A")) for ch in channels_info]
-        excitation_wavelengths = [safe_round(ch.get("ExcitationWavelength", "N/A")) for ch in channels_info]
-        emission_wavelengths = [safe_round(ch.get("EmissionWavelength", "N/A")) for ch in channels_info]
-        acquisition_modes = [ch.get("AcquisitionMode", "N/A") for ch in channels_info]
-        dye_names = [ch.get("Fluor", "N/A") for ch in channels_info]
-        zoom_list = []
-        for ch in channels_info:
-            zoom_x = safe_get(ch, "LaserScanInfo", "ZoomX")
-            try:
-                zoom_x = round(float(zoom_x), 3)
-            except Exception:
-                pass
-            zoom_list.append(zoom_x)
+        metadata_output["MM.TotalMagnification (per channel)"] = round_list(
+            [_find_text(c.get("CustomAttributes", _EMPTY), "MM.TotalMagnification") for c in channel_children]
+        )
 
-        # --- Per-detector wavelength ranges ---
-        tracks = ensure_list(track_meta.get("TrackSetup", []))
+        # --- Per-detector wavelength ranges and channel -> pinhole indexes ---
+        # One pass over every track's detectors; the indexes spare the per-channel lookups below a rescan.
+        # Only detectors that carry a value are indexed, so a channel repeated in a later track still
+        # picks up that track's value when an earlier one lacks it.
         all_detector_wavelength_ranges = []
-        for track in tracks:
-            detectors = ensure_list(track.get("Detectors", {}).get("Detector", []))
-            for detector in detectors:
-                wl_range = detector.get("DetectorWavelengthRanges", {}).get("DetectorWavelengthRange", {})
-                if isinstance(wl_range, dict):
-                    wl_start = wl_range.get("WavelengthStart", "N/A")
-                    wl_end = wl_range.get("WavelengthEnd", "N/A")
+        pinhole_by_channel = {}
+        airy_by_channel = {}
+        cha_filterset = None
+        for detector in acquisition_meta.iterfind(_DETECTOR_PATH):
+            wl_ranges = detector.findall("DetectorWavelengthRanges/DetectorWavelengthRange")
+            if len(wl_ranges) <= 1:
+                wl_range = wl_ranges[0] if wl_ranges else _EMPTY
+                wl_start = _find_text(wl_range, "WavelengthStart")
+                wl_end = _find_text(wl_range, "WavelengthEnd")
+                try:
+                    wl_start_nm = round(float(wl_start) * 1e9, 3)
+                    wl_end_nm = round(float(wl_end) * 1e9, 3)
+                    detector_wavelength_range = f"{wl_start_nm} - {wl_end_nm}"
+                except Exception:
+                    detector_wavelength_range = f"{wl_start} - {wl_end}"
+            else:
+                detector_wavelength_range = "N/A"
+            all_detector_wavelength_ranges.append(detector_wavelength_range)
+
+            det_channel = _find_text(detector, "ImageChannelName", "")
+            if det_channel not in pinhole_by_channel:
+                try:
+                    pinhole_by_channel[det_channel] = round(float(_find_text(detector, "PinholeDiameter")) * 1e6, 3)
+                except Exception:
+                    pass
+            if detector.get("Name") == "Airyscan" and det_channel not in airy_by_channel:
+                airy_val = _find_text(detector, "AiryScanVirtualPinholeSize", None)
+                if airy_val is not None:
                     try:
-                        wl_start_nm = round(float(wl_start) * 1e9, 3)
-                        wl_end_nm = round(float(wl_end) * 1e9, 3)
-                        detector_wavelength_range = f"{wl_start_nm} - {wl_end_nm}"
+                        airy_by_channel[det_channel] = round(float(airy_val) * 1e6, 3)
                     except Exception:
-                        detector_wavelength_range = f"{wl_start} - {wl_end}"
-                else:
-                    detector_wavelength_range = "N/A"
-                all_detector_wavelength_ranges.append(detector_wavelength_range)
-
-        # --- Per-channel Airyscan Virtual Pinhole Size ---
-        airy_scan_virtual_pinhole_sizes = []
-        for channel_name in channel_names:
-            value = "N/A"
-            for track in tracks:
-                detectors = ensure_list(track.get("Detectors", {}).get("Detector", []))
-                for detector in detectors:
-                    if detector.get("@Name") == "Airyscan":
-                        det_channel = detector.get("ImageChannelName", "")
-                        if det_channel == channel_name or det_channel in channel_name or channel_name in det_channel:
-                            airy_val = detector.get("AiryScanVirtualPinholeSize", None)
-                            if airy_val is not None:
-                                try:
-                                    value = round(float(airy_val) * 1e6, 3)
-                                except Exception:
-                                    value = airy_val
-                            break
-                if value != "N/A":
-                    break
-            airy_scan_virtual_pinhole_sizes.append(value)
-
-        # --- Per-channel Pinhole Diameter (um) ---
-        all_pinhole_diameters = []
-        for channel_name in channel_names:
-            pinhole_diameter_um = "N/A"
-            for track in tracks:
-                detectors = ensure_list(track.get("Detectors", {}).get("Detector", []))
-                for detector in detectors:
-                    det_channel = detector.get("ImageChannelName", "")
-                    if det_channel == channel_name or det_channel in channel_name or channel_name in det_channel:
-                        pinhole_diameter = detector.get("PinholeDiameter", None)
-                        if pinhole_diameter is None or pinhole_diameter == "" or pinhole_diameter == "N/A":
-                            pinhole_diameter_um = "N/A"
-                        else:
-                            try:
-                                pinhole_diameter_um = round(float(pinhole_diameter) * 1e6, 3)
-                            except Exception:
-                                pinhole_diameter_um = "N/A"
-                        break
-                if pinhole_diameter_um != "N/A":
-                    break
-            all_pinhole_diameters.append(pinhole_diameter_um)
-
-        # --- Time Interval (s) ---
-        time_interval = "N/A"
-        try:
-            time_interval = (
-                safe_get(acquisition_meta, "SubDimensionSetups", "TimeSeriesSetup", "Interval", "TimeSpan", "Value")
-            )
-            if time_interval != "N/A":
-                time_interval = float(time_interval)
-        except Exception:
-            pass
-
-        # --- Assemble metadata output ---
-        metadata_output = {
-            "Document Name": document_name,
-            "Document User Name": document_user_name,
-            "Document Creation Date": document_creation_date,
-            "Application Name": application_name,
-            "Application Version": application_version,
-            "System Name": system_name,
-            "Pixel Type": pixel_type,
-            "Size X": size_x,
-            "Size Y": size_y,
-            "Size Z": size_z,
-            "Size M": size_m,
-            "Size T": size_t,
-            "Size C": size_c,
-            "Size S": size_s,
-            "Pixel Size X (um)": pixel_Size_X,
-            "Pixel Size Y (um)": pixel_Size_Y,
-            "Pixel Size Z (um)": pixel_Size_Z,
-            "Image Size X (um)": image_size_x,
-            "Image Size Y (um)": image_size_y,
-            "Image Size Z (um)": image_size_z,
-            "Time Interval (s)": time_interval,
-            "Objective Model": objective_model,
-            "Objective NA": objective_NA,
-            "Objective Magnification": objective_mag,
-            "Objective Refractive Index": objective_RI,
-            "Objective Medium": objective_Medium,
-            "Illumination_Types": illumination_Types,
-            "Contrast Methods": contrast_Methods,
-            "Acquisition Modes": acquisition_modes,
-            "Channel Names": channel_names,
-            "Dye Names": dye_names,
-            "Excitation Wavelengths": excitation_wavelengths,
-            "Emission Wavelengths": emission_wavelengths,
-            "Emission Wavelength Range (nm)": all_detector_wavelength_ranges,
-            "Pinhole Sizes (Airy Units)": pinhole_Sizes,
-            "Pinhole Diameters (um)": all_pinhole_diameters,
-            "AiryScan Virtual Pinhole Size (um)": airy_scan_virtual_pinhole_sizes,
-            "Zoom": zoom_list,
-            "MM.TotalMagnification (per channel)": total_magnifications,
-        }
+                        airy_by_channel[det_channel] = airy_val
+            if cha_filterset is None and "ChA" in det_channel:
+                cha_filterset = _find_text(detector, "Filtersets/Filterset", None)
+        metadata_output["Emission Wavelength Range (nm)"] = all_detector_wavelength_ranges
+
+        # --- Per-channel Pinhole Diameter (um) and Airyscan Virtual Pinhole Size ---
+        metadata_output["Pinhole Diameters (um)"] = [_match_channel(name, pinhole_by_channel) for name in channel_names]
+        metadata_output["AiryScan Virtual Pinhole Size (um)"] = [_match_channel(name, airy_by_channel) for name in channel_names]
 
         # --- Update Emission Wavelength Range for any channel containing 'ChA' ---
-        for i, channel_name in enumerate(metadata_output["Channel Names"]):
-            if "ChA" in channel_name:
-                filterset_value = None
-                for track in tracks:
-                    detectors = ensure_list(track.get("Detectors", {}).get("Detector", []))
-                    for detector in detectors:
-                        if "ChA" in detector.get("ImageChannelName", ""):
-                            filtersets = detector.get("Filtersets", {})
-                            filterset_value = filtersets.get("Filterset", None)
-                            break
-                    if filterset_value:
-                        break
-                if filterset_value:
-                    metadata_output["Emission Wavelength Range (nm)"][i] = filterset_value
+        if cha_filterset:
+            for i, channel_name in enumerate(metadata_output["Channel Names"]):
+                if "ChA" in channel_name:
+                    metadata_output["Emission Wavelength Range (nm)"][i] = cha_filterset
 
         return metadata_output, metadata_dict
@@ -7,10 +7,13 @@ def extract_lif_metadata(lif_path):
     lif_file = LifFile(lif_path)
     metadata_list = []
     xml_header = lif_file.xml_header
+    # Parse and index the header once and share them between every image and the timestamp scan below
+    root_xml = ET.fromstring(xml_header)
+    attr_index = _index_attributes(root_xml)
 
     for idx, image in enumerate(lif_file.get_iter_image()):
         info = image.info
-        meta = extract_leica_metadata(info, xml_header)
+        meta = extract_leica_metadata(info, xml_header, root=root_xml, attr_index=attr_index)
         meta["Image Index"] = idx + 1
         meta["Image Name"] = info.get('name', 'Unnamed')
         meta["Dimensions"] = str(info.get("dims", "N/A"))
@@ -31,7 +34,6 @@ def extract_lif_metadata(lif_path):
             metadata_list[0][f"Header_{tag}"] = date
 
     # Timestamps
-    root_xml = ET.fromstring(xml_header)
     timestamps = []
     for elem in root_xml.iter():
         if 'timestamp' in elem.attrib:
@@ -51,10 +53,21 @@ def extract_lif_metadata(lif_path):
 
     return metadata_list
 
-def extract_leica_metadata(info, xml_header):
-    import xml.etree.ElementTree as ET
-
-    root = ET.fromstring(xml_header)
+def _index_attributes(root):
+    """Map each attribute name to its first value in document order, in a single walk of the tree."""
+    index = {}
+    for elem in root.iter():
+        for name, value in elem.attrib.items():
+            if name not in index:
+                index[name] = value
+    return index
+
+def extract_leica_metadata(info, xml_header, root=None, attr_index=None):
+    """Build the summary dict for one image; pass root and attr_index to reuse an already parsed and indexed xml_header."""
+    if root is None:
+        root = ET.fromstring(xml_header)
+    if attr_index is None:
+        attr_index = _index_attributes(root)
     settings = info.get("settings", {})
     dims = info.get("dims", None)
     scale = info.get("scale", (None, None, None))
@@ -66,11 +79,13 @@ def extract_leica_metadata(info, xml_header):
                 return elem.text
         return "N/A"
 
+    # Every attribute lookup below reads from one index instead of walking the whole tree again
     def find_attr(attr):
-        for elem in root.iter():
-            if attr in elem.attrib:
-                return elem.attrib[attr]
-        return "N/A"
+        return attr_index.get(attr, "N/A")
+
+    # Only fall back to the XML when readlif's settings lack the key, rather than evaluating the fallback every time
+    def setting_or_attr(key):
+        return settings[key] if key in settings else find_attr(key)
 
     app_name = app_version = "N/A"
     for att in root.findall(".//Attachment"):
@@ -79,15 +94,6 @@ def extract_leica_metadata(info, xml_header):
         if "Application" in att.attrib:
             app_name = att.attrib["Application"]
 
-    # Unique channel names
-    channel_names = []
-    seen_channels = set()
-    for ch in root.findall(".//ChannelDescription"):
-        name = ch.attrib.get("LUTName") or ch.attrib.get("ChannelName") or ch.attrib.get("NameOfMeasuredQuantity") or "N/A"
-        if name not in seen_channels:
-            channel_names.append(name)
-            seen_channels.add(name)
-
     dye_names = []
     excitation_wavelengths = []
     emission_wavelengths = []
@@ -97,13 +103,22 @@ def extract_leica_metadata(info, xml_header):
     airy_virtual_pinhole = []
     zooms = []
 
-    for ch in root.findall(".//ChannelDescription"):
-        name = ch.attrib.get("LUTName") or ch.attrib.get("ChannelName") or ch.attrib.get("NameOfMeasuredQuantity") or "N/A"
-        channel_names.append(name)
-        if "PinholeAiry" in ch.attrib:
-            pinhole_sizes.append(ch.attrib["PinholeAiry"])
-        if "Pinhole" in ch.attrib:
-            pinhole_diameters.append(ch.attrib["Pinhole"])
+    # One pass over the channels: the name list is the unique names followed by every name in order
+    unique_names = []
+    all_names = []
+    seen_channels = set()
+    for ch in root.iter("ChannelDescription"):
+        attrib = ch.attrib
+        name = attrib.get("LUTName") or attrib.get("ChannelName") or attrib.get("NameOfMeasuredQuantity") or "N/A"
+        if name not in seen_channels:
+            unique_names.append(name)
+            seen_channels.add(name)
+        all_names.append(name)
+        if "PinholeAiry" in attrib:
+            pinhole_sizes.append(attrib["PinholeAiry"])
+        if "Pinhole" in attrib:
+            pinhole_diameters.append(attrib["Pinhole"])
+    channel_names = unique_names + all_names
 
     for mb in root.findall(".//MultiBand"):
         dye_names.append(mb.attrib.get("DyeName", "N/A"))
@@ -133,7 +148,7 @@ def extract_leica_metadata(info, xml_header):
                 active_em_waves.append(det.attrib.get("ChannelName"))
 
     meta = {
-        "Document Name": info.get("name", find_tag("Name")),
+        "Document Name": info["name"] if "name" in info else find_tag("Name"),
         "Document User Name": find_attr("UserName"),
         "Document Creation Date": find_attr("CreationDate") or find_tag("CreationDate"),
         "Application Name": app_name,
@@ -154,11 +169,11 @@ def extract_leica_metadata(info, xml_header):
         "Image Size Y (um)": float(scale[1])*dims.y if scale and dims and scale[1] else "N/A",
         "Image Size Z (um)": float(scale[2])*dims.z if scale and dims and scale[2] else "N/A",
         "Time Interval (s)": find_attr("TimeInterval"),
-        "Objective Model": settings.get("ObjectiveName", find_attr("ObjectiveName")),
-        "Objective NA": settings.get("NumericalAperture", find_attr("NumericalAperture")),
-        "Objective Magnification": settings.get("Magnification", find_attr("Magnification")),
-        "Objective Refractive Index": settings.get("RefractionIndex", find_attr("RefractionIndex")),
-        "Objective Medium": settings.get("Immersion", find_attr("Immersion")),
+        "Objective Model": setting_or_attr("ObjectiveName"),
+        "Objective NA": setting_or_attr("NumericalAperture"),
+        "Objective Magnification": setting_or_attr("Magnification"),
+        "Objective Refractive Index": setting_or_attr("RefractionIndex"),
+        "Objective Medium": setting_or_attr("Immersion"),
         "Illumination_Types": find_attr("IlluminationType"),
         "Contrast Methods": find_attr("ContrastMethod"),
         "Acquisition Modes": find_attr("AcquisitionMode"),
@@ -38,8 +38,8 @@ def extract_nd2_metadata(file_path):
             
             # Dimension sizes
             try:
-                if hasattr(nd2, 'sizes') and nd2.sizes:
-                    sizes = nd2.sizes
+                sizes = getattr(nd2, 'sizes', None)
+                if sizes:
                     metadata["Time Points"] = str(sizes.get('T', 1))
                     metadata["Channels"] = str(sizes.get('C', 1))
                     metadata["Z Slices"] = str(sizes.get('Z', 1))
@@ -64,8 +64,8 @@ def extract_nd2_metadata(file_path):
             
             # Experiment information
             try:
-                if hasattr(nd2, 'experiment') and nd2.experiment:
-                    exp = nd2.experiment
+                exp = getattr(nd2, 'experiment', None)
+                if exp:
                     if isinstance(exp, (list, tuple)) and len(exp) > 0:
                         exp = exp[0]
                     
@@ -84,8 +84,9 @@ def extract_nd2_metadata(file_path):
             
             # System information
             try:
-                if hasattr(nd2, 'custom_data') and nd2.custom_data:
-                    custom = nd2.custom_data
+                # custom_data decodes every custom-data chunk in the file, so only do it once
+                custom = getattr(nd2, 'custom_data', None)
+                if custom:
                     if isinstance(custom, dict):
                         # Look for hardware settings
                         if 'HardwareSetting' in custom:
@@ -97,9 +98,11 @@ def extract_nd2_metadata(file_path):
                 pass
             
             # CORRECTED: Objective and microscope information from metadata.channels
+            # The metadata object is read once here and shared with the channel block below
+            meta = None
             try:
-                if hasattr(nd2, 'metadata') and nd2.metadata:
-                    meta = nd2.metadata
+                meta = getattr(nd2, 'metadata', None)
+                if meta:
                     # Access channels directly from metadata object
                     if hasattr(meta, 'channels') and meta.channels:
                         channels = meta.channels
@@ -138,8 +141,7 @@ def extract_nd2_metadata(file_path):
             try:
                 channel_names = []
                 channel_details = []
-                if hasattr(nd2, 'metadata') and nd2.metadata:
-                    meta = nd2.metadata
+                if meta:
                     # Access channels directly from metadata object
                     if hasattr(meta, 'channels') and meta.channels:
                         channels = meta.channels
@@ -172,8 +174,8 @@ def extract_nd2_metadata(file_path):
             
             # Pixel size information
             try:
-                if hasattr(nd2, 'voxel_size') and nd2.voxel_size:
-                    voxel = nd2.voxel_size
+                voxel = getattr(nd2, 'voxel_size', None)
+                if voxel:
                     metadata["Pixel Size X"] = f"{voxel.x:.6f}" if hasattr(voxel, 'x') and voxel.x else "N/A"
                     metadata["Pixel Size Y"] = f"{voxel.y:.6f}" if hasattr(voxel, 'y') and voxel.y else "N/A"
                     metadata["Pixel Size Z"] = f"{voxel.z:.6f}" if hasattr(voxel, 'z') and voxel.z else "N/A"
@@ -195,8 +197,8 @@ def extract_nd2_metadata(file_path):
             
             # Additional metadata from text_info
             try:
-                if hasattr(nd2, 'text_info') and nd2.text_info:
-                    text_info = nd2.text_info
+                text_info = getattr(nd2, 'text_info', None)
+                if text_info:
                     if isinstance(text_info, dict):
                         # Common text info fields
                         metadata["Document User Name"] = text_info.get('sUser', 'N/A')
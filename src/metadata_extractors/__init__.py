@@ -2,9 +2,16 @@
 Metadata extraction modules for different microscopy file formats.
 """
 
-from .CZI_MetadataGUI import extract_metadata
-from .LIF_MetadataGUI import extract_lif_metadata
-from .Nd2_v2a import extract_nd2_metadata, map_nd2_to_remind_fields
+import importlib
+
+# Each extractor pulls in its reader library (pylibCZIrw, readlif, nd2), so they are only
+# imported when first accessed rather than when the package is
+_EXPORTS = {
+    'extract_metadata': '.CZI_MetadataGUI',
+    'extract_lif_metadata': '.LIF_MetadataGUI',
+    'extract_nd2_metadata': '.Nd2_v2a',
+    'map_nd2_to_remind_fields': '.Nd2_v2a',
+}
 
 __all__ = [
     'extract_metadata',
@@ -12,3 +19,12 @@ __all__ = [
     'extract_nd2_metadata',
     'map_nd2_to_remind_fields'
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value